@@ -4,7 +4,7 @@ import math
 from typing import Any, Sequence
 
 from matplotlib.patches import PathPatch
-from shapely import intersects_xy
+from shapely import intersects_xy, prepare
 from shapely.geometry import LineString, MultiLineString
 from shapely.plotting import patch_from_polygon
 
@@ -129,6 +129,8 @@ class Hallway(Entity):
         self.internal_collision_polygon = self.internal_collision_polygon.difference(
             inflate_polygon(self.room_end.polygon, -inflation_radius)
         )
+        # Prepared for the repeated point and lidar ray queries against it.
+        prepare(self.internal_collision_polygon)
 
         # External collision polygon:
         # Inflate the difference polygon by the wall width
@@ -152,6 +154,7 @@ class Hallway(Entity):
         self.inflated_closed_polygon = inflate_polygon(
             self.closed_polygon, inflation_radius
         )
+        prepare(self.inflated_closed_polygon)
 
     def update_visualization_polygon(self) -> None:
         """Updates the visualization polygon for the hallway walls."""
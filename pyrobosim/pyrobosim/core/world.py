@@ -76,6 +76,13 @@ class World:
         # Polygons for collision checking
         self.total_internal_polygon = Polygon()
         self.total_external_polygon = Polygon()
+        # Spatial index of hallway collision polygons, set by update_polygons().
+        # Tree indices correspond to the hallways in the list stored with it, and
+        # both are replaced together so other threads always see a matching pair.
+        self.hallway_index: tuple[shapely.STRtree, list[Hallway]] = (
+            shapely.STRtree([]),
+            [],
+        )
 
         # Other parameters
         # Max number of tries to sample object locations
@@ -412,9 +419,10 @@ class World:
             self.name_to_entity.pop(resolved_hallway.reversed_name)
         for room in [resolved_hallway.room_start, resolved_hallway.room_end]:
             room.hallways.remove(resolved_hallway)
-            room.update_collision_polygons()
+            room.update_collision_polygons(self.inflation_radius)
             room.update_visualization_polygon()
             self.update_bounds(entity=resolved_hallway, remove=True)
+        self.update_polygons()
         return True
 
     def remove_all_hallways(self, restart_numbering: bool = True) -> None:
@@ -1704,6 +1712,12 @@ class World:
         )
         shapely.prepare(self.total_external_polygon)
 
+        hallways = list(self.hallways)
+        self.hallway_index = (
+            shapely.STRtree([hall.internal_collision_polygon for hall in hallways]),
+            hallways,
+        )
+
         for robot in self.robots:
             robot.update_polygons()
 
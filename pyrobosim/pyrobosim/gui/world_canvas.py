@@ -115,7 +115,7 @@ class WorldCanvas(FigureCanvasQTAgg):  # type: ignore [misc]
         self.room_texts: list[Text] = []
         self.location_patches: list[PathPatch] = []
         self.location_texts: list[Text] = []
-        self.path_planner_artists: dict[str, Artist] = {"graph": [], "path": []}
+        self.path_planner_artists: dict[str, list[Artist]] = {"graph": [], "path": []}
         self.show_collision_polygons = False
         self.show_room_names = True
         self.show_object_names = True
@@ -439,18 +439,17 @@ class WorldCanvas(FigureCanvasQTAgg):  # type: ignore [misc]
             if robot.path_planner:
                 graphs = robot.path_planner.get_graphs() if show_graphs else []
                 path = path or robot.path_planner.get_latest_path()
+                # Existing artists are updated in place, and unused ones are removed.
                 path_planner_artists = plot_path_planner(
-                    self.axes, graphs=graphs, path=path, path_color=color
+                    self.axes,
+                    graphs=graphs,
+                    path=path,
+                    path_color=color,
+                    artists=self.path_planner_artists,
                 )
-
-                for artist in self.path_planner_artists["graph"]:
-                    artist.remove()
                 self.path_planner_artists["graph"] = path_planner_artists.get(
                     "graph", []
                 )
-
-                for artist in self.path_planner_artists["path"]:
-                    artist.remove()
                 self.path_planner_artists["path"] = path_planner_artists.get("path", [])
 
         self.draw_and_sleep()
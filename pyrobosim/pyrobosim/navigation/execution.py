@@ -1,11 +1,11 @@
 """Path execution utilities."""
 
 import time
-from threading import Thread
+from threading import Event, Thread
 from typing import Any
 
-from shapely import intersection_all
-from shapely.ops import unary_union
+import numpy as np
+from shapely.geometry import Polygon
 
 from .types import PathExecutor
 from ..planning.actions import ExecutionResult, ExecutionStatus
@@ -13,7 +13,7 @@ from ..sensors.lidar import Lidar2D
 from ..utils.logging import get_global_logger
 from ..utils.path import Path
 from ..utils.trajectory import get_constant_speed_trajectory, interpolate_trajectory
-from ..utils.world_collision import is_path_collision_free
+from ..utils.world_collision import is_path_collision_free_xy
 
 
 class ConstantVelocityExecutor(PathExecutor):
@@ -40,7 +40,7 @@ class ConstantVelocityExecutor(PathExecutor):
         :param dt: Time step for creating a trajectory, in seconds.
         :param linear_velocity: Linear velocity, in m/s.
         :param max_angular_velocity: Maximum angular velocity, in rad/s.
-        :param validate_during_execution: If True, runs a separate thread that validates the remaining path at a regular rate.
+        :param validate_during_execution: If True, validates the remaining path at a regular rate during execution.
         :param validation_dt: Time step for validating the remaining path, in seconds.
         :param validation_step_dist: The step size for discretizing a straight line to check collisions.
         :param lidar_sensor_name: Name of the lidar sensor to use for detecting closed hallways.
@@ -51,7 +51,6 @@ class ConstantVelocityExecutor(PathExecutor):
         self.linear_velocity = linear_velocity
         self.max_angular_velocity = max_angular_velocity
 
-        self.validation_timer: Thread | None = None
         self.validate_during_execution = validate_during_execution
         self.validation_dt = validation_dt
         self.validation_step_dist = validation_step_dist
@@ -71,6 +70,8 @@ class ConstantVelocityExecutor(PathExecutor):
         self.following_path = False  # Flag to track path following
         self.abort_execution = False  # Flag to abort internally
         self.cancel_execution = False  # Flag to cancel from user
+        # Collision polygon against which the remaining trajectory waypoints were validated
+        self.validated_collision_polygon: Polygon | None = None
 
     def execute(
         self, path: Path, realtime_factor: float = 1.0, battery_usage: float = 0.0
@@ -122,32 +123,38 @@ class ConstantVelocityExecutor(PathExecutor):
                 message=message,
             )
 
+        # Precompute the battery usage of each trajectory step.
+        step_dists = np.sqrt(
+            np.diff(traj_interp.xs) ** 2
+            + np.diff(traj_interp.ys) ** 2
+            + np.diff(traj_interp.zs) ** 2
+        )
+        step_battery_usage = [0.0] + (battery_usage * step_dists).tolist()
+
         self.reset_state()
         self.following_path = True
 
-        # Optionally, kick off the path validation timer.
-        if self.validate_during_execution and self.robot.world is not None:
-            self.validation_timer = Thread(target=self.validate_remaining_path)
-            self.validation_timer.start()
-
         # Execute the trajectory.
         status = ExecutionStatus.SUCCESS
         message = ""
         sleep_time = self.dt / realtime_factor
-        prev_pose = traj_interp.poses[0]
+        next_step_time = time.monotonic()
+
+        # Optionally, validate the remaining path every few execution steps.
+        validate = self.validate_during_execution and (self.robot.world is not None)
+        validation_steps = max(1, round(self.validation_dt / sleep_time))
+
         for i in range(traj_interp.num_points()):
-            start_time = time.time()
             cur_pose = traj_interp.poses[i]
             self.current_traj_time = traj_interp.t_pts[i]
             self.robot.set_pose(cur_pose)
             if self.robot.manipulated_object is not None:
                 self.robot.manipulated_object.set_pose(cur_pose)
 
+            if validate and (i % validation_steps == 0):
+                self.validate_remaining_path()
+
             if self.abort_execution:
-                if self.validate_during_execution and (
-                    self.validation_timer is not None
-                ):
-                    self.validation_timer.join()
                 message = "Trajectory execution aborted."
                 self.robot.logger.info(message)
                 status = ExecutionStatus.EXECUTION_FAILURE
@@ -160,9 +167,7 @@ class ConstantVelocityExecutor(PathExecutor):
                 break
 
             # Simulate battery usage and exit if the battery is fully depleted.
-            self.robot.battery_level -= battery_usage * cur_pose.get_linear_distance(
-                prev_pose
-            )
+            self.robot.battery_level -= step_battery_usage[i]
             if self.robot.battery_level <= 0.0:
                 self.robot.battery_level = 0.0
                 message = "Battery depleted while navigating."
@@ -170,12 +175,10 @@ class ConstantVelocityExecutor(PathExecutor):
                 status = ExecutionStatus.EXECUTION_FAILURE
                 break
 
-            prev_pose = cur_pose
-            time.sleep(max(0, sleep_time - (time.time() - start_time)))
+            next_step_time = self.sleep_until_next_step(next_step_time, sleep_time)
 
         # Finalize path execution.
         self.reset_state()
-        time.sleep(0.1)  # To ensure background threads get the end of the path.
         self.robot.last_nav_result = ExecutionResult(status=status, message=message)
         return self.robot.last_nav_result
 
@@ -186,42 +189,46 @@ class ConstantVelocityExecutor(PathExecutor):
         """
         Validates the remaining path by checking collisions against the world.
 
-        This function will set the `abort_execution` attribute to `True`,
-        which cancels the main trajectory execution loop.
+        This is called from the main trajectory execution loop every `validation_dt` seconds.
+        If the remaining path is in collision, this function will set the `abort_execution`
+        attribute to `True`, which cancels the main trajectory execution loop.
         """
         if (self.robot is None) or (self.traj is None):
             return
 
-        while self.following_path and (not self.abort_execution):
-            start_time = time.time()
-            cur_pose = self.robot.get_pose()
-            cur_time = self.current_traj_time
-
-            # Get the waypoint index of the remaining path.
-            for idx, t in enumerate(self.traj.t_pts):
-                if t >= cur_time:
-                    break
-            if idx == self.traj.num_points() - 1:
-                return
-
-            # Collision check the remaining path.
-            poses = [cur_pose]
-            poses.extend(self.traj.poses[idx:])
-            if len(poses) > 2:
-                remaining_path = Path(poses=poses)
-                if (self.robot.world is not None) and (
-                    not is_path_collision_free(
-                        remaining_path,
-                        robot=self.robot,
-                        step_dist=self.validation_step_dist,
-                    )
-                ):
-                    self.robot.logger.warning(
-                        "Remaining path is in collision. Aborting execution."
-                    )
-                    self.abort_execution = True
-
-            time.sleep(max(0, self.validation_dt - (time.time() - start_time)))
+        cur_pose = self.robot.get_pose()
+        cur_time = self.current_traj_time
+
+        # Get the waypoint index of the remaining path.
+        # The time points are sorted, so this is a binary search.
+        idx = int(np.searchsorted(self.traj.t_pts, cur_time, side="left"))
+        if idx >= self.traj.num_points() - 1:
+            return
+
+        # Collision check the remaining path.
+        # The segments between the remaining trajectory waypoints only need to be
+        # checked again if the collision polygon changed since they were validated.
+        # Otherwise, only the segment from the current pose to the next waypoint is new.
+        collision_polygon = self.robot.total_internal_polygon
+        end_idx = (
+            idx + 1 if collision_polygon is self.validated_collision_polygon else None
+        )
+        xs = np.concatenate(([cur_pose.x], self.traj.xs[idx:end_idx]))
+        ys = np.concatenate(([cur_pose.y], self.traj.ys[idx:end_idx]))
+        if (self.robot.world is not None) and (
+            not is_path_collision_free_xy(
+                xs,
+                ys,
+                robot=self.robot,
+                step_dist=self.validation_step_dist,
+            )
+        ):
+            self.robot.logger.warning(
+                "Remaining path is in collision. Aborting execution."
+            )
+            self.abort_execution = True
+        else:
+            self.validated_collision_polygon = collision_polygon
 
     def validate_sensors_for_partial_obs_hallways(self) -> None:
         """
@@ -262,52 +269,88 @@ class ConstantVelocityExecutor(PathExecutor):
         lidar_sensor = self.robot.sensors.get(self.lidar_sensor_name)
         assert isinstance(lidar_sensor, Lidar2D)
 
+        # These do not change while the loop runs.
+        robot = self.robot
+        recorded_closed_hallways = robot.recorded_closed_hallways
+        measurement_dt = self.lidar_sensor_measurement_dt
+
         # Start the loop
+        next_step_time = time.monotonic()
         while not self.cancel_all_threads:
-            start_time = time.time()
-
-            if self.robot.world is not None:
-                for h in self.robot.world.hallways:
-
-                    # Check if hallway state differs between ground truth and robot's knowledge.
-                    state_differs = (
-                        h.is_open and h in self.robot.recorded_closed_hallways
-                    ) or (
-                        not h.is_open and h not in self.robot.recorded_closed_hallways
-                    )
-
-                    # Skip other checks if the state does not differ.
-                    if not state_differs:
-                        continue
-
-                    # Check if lidar is measuring a hallway.
-                    intersects_lidar = intersection_all(
-                        [
-                            unary_union(lidar_sensor.lidar_lines),
-                            h.internal_collision_polygon,
-                        ]
-                    )
-
-                    # If yes, update the robot's knowledge.
-                    if intersects_lidar:
-                        if not h.is_open:
-                            self.robot.recorded_closed_hallways.add(h)
-                            self.robot.logger.info(
-                                f"Added {h.name} into closed knowledge."
-                            )
+
+            # The robot can be added to a world after this loop starts.
+            world = robot.world
+            lidar_lines = lidar_sensor.lidar_lines
+            if (world is not None) and (len(lidar_lines) > 0):
+                lidar_rays = np.asarray(lidar_lines)
+
+                # The tree and its hallways are read together, as the world may
+                # replace them from another thread.
+                hallway_tree, hallways = world.hallway_index
+
+                # Find every intersecting (lidar ray, hallway) pair in a single query
+                # of the hallway spatial index.
+                # The whole ray is tested, not just its hit point, since an open
+                # hallway is observed by beams that travel through it.
+                _, hit_idxs = hallway_tree.query(lidar_rays, predicate="intersects")
+
+                hallways_to_add = []
+                hallways_to_remove = []
+                for idx in np.unique(hit_idxs):
+                    h = hallways[idx]
+
+                    # If the ground truth differs from the robot's knowledge of this
+                    # hallway, the knowledge needs updating.
+                    if h.is_open == (h in recorded_closed_hallways):
+                        if h.is_open:
+                            hallways_to_remove.append(h)
                         else:
-                            self.robot.recorded_closed_hallways.remove(h)
-                            self.robot.logger.info(
-                                f"Removed {h.name} from closed knowledge."
-                            )
+                            hallways_to_add.append(h)
+
+                # Apply all the knowledge updates from this measurement at once,
+                # so the robot polygons and the GUI are only updated once.
+                if hallways_to_add or hallways_to_remove:
+                    recorded_closed_hallways.update(hallways_to_add)
+                    recorded_closed_hallways.difference_update(hallways_to_remove)
+                    for h in hallways_to_add:
+                        robot.logger.info(f"Added {h.name} into closed knowledge.")
+                    for h in hallways_to_remove:
+                        robot.logger.info(f"Removed {h.name} from closed knowledge.")
+
+                    robot.update_polygons()
+                    if world.gui is not None:
+                        world.gui.canvas.show_hallways_signal.emit()
+
+            next_step_time = self.sleep_until_next_step(
+                next_step_time, measurement_dt, stop_event=self.cancel_threads_event
+            )
 
-                        self.robot.update_polygons()
-                        if self.robot.world.gui is not None:
-                            self.robot.world.gui.canvas.show_hallways_signal.emit()
+    @staticmethod
+    def sleep_until_next_step(
+        prev_step_time: float, step_time: float, stop_event: Event | None = None
+    ) -> float:
+        """
+        Sleeps until the next step of a fixed-rate loop.
 
-            time.sleep(
-                max(0, self.lidar_sensor_measurement_dt - (time.time() - start_time))
-            )
+        Steps are scheduled from the previous step's deadline using a monotonic
+        clock, so sleep overshoot does not accumulate over the loop. If the loop
+        has fallen behind schedule, the next step starts immediately and the
+        schedule is restarted from the current time.
+
+        :param prev_step_time: The monotonic time of the previous step, in seconds.
+        :param step_time: The time between steps, in seconds.
+        :param stop_event: If specified, the sleep ends early when this event is set.
+        :return: The monotonic time of the next step, in seconds.
+        """
+        next_step_time = prev_step_time + step_time
+        remaining_time = next_step_time - time.monotonic()
+        if remaining_time > 0.0:
+            if stop_event is None:
+                time.sleep(remaining_time)
+            else:
+                stop_event.wait(remaining_time)
+            return next_step_time
+        return time.monotonic()
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -99,9 +99,9 @@ class RRTPlanner(PathPlanner):
         n_goal = Node(goal, parent=None)
         n_goal_start_tree: Node | None = None
         n_goal_goal_tree: Node | None = None
-        self.graph_start.nodes = {n_start}
+        self.graph_start.add_node(n_start)
         if self.bidirectional:
-            self.graph_goal.nodes = {n_goal}
+            self.graph_goal.add_node(n_goal)
 
         # If the goal is within max connection distance of the start, connect them directly
         if is_connectable(
@@ -311,9 +311,7 @@ class RRTPlanner(PathPlanner):
             n_tgt.parent = n_rewire
             for e in graph.edges:
                 if e.nodeA == n_tgt or e.nodeB == n_tgt:
-                    e.nodeA.neighbors.remove(e.nodeB)
-                    e.nodeB.neighbors.remove(e.nodeA)
-                    graph.edges.remove(e)
+                    graph.remove_edge(e.nodeA, e.nodeB)
                     break
             graph.add_edge(n_tgt, n_tgt.parent)
             self.n_rewires += 1
@@ -350,7 +348,7 @@ class RRTPlanner(PathPlanner):
                 self.max_connection_dist,
             ):
                 n_tgt.parent = n_curr
-                graph.nodes.add(n_tgt)
+                graph.add_node(n_tgt)
                 if self.rrt_star:
                     self.rewire_node(graph, n_tgt)
                 return True, n_tgt
@@ -2,6 +2,7 @@
 Basic types for path planning and navigation.
 """
 
+from threading import Event
 from typing import Any
 
 from ..planning.actions import ExecutionResult
@@ -92,7 +93,20 @@ class PathExecutor:
         from ..core.robot import Robot
 
         self.robot: Robot | None = None
-        self.cancel_all_threads = False
+        # Background threads wait on this event between steps, so they stop as soon as it is set.
+        self.cancel_threads_event = Event()
+
+    @property
+    def cancel_all_threads(self) -> bool:
+        """Flag to cancel all the executor's background threads."""
+        return self.cancel_threads_event.is_set()
+
+    @cancel_all_threads.setter
+    def cancel_all_threads(self, cancel: bool) -> None:
+        if cancel:
+            self.cancel_threads_event.set()
+        else:
+            self.cancel_threads_event.clear()
 
     def execute(
         self, path: Path, realtime_factor: float = 1.0, battery_usage: float = 0.0
@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 from ..utils.path import Path
 from ..utils.search_graph import SearchGraph
@@ -16,6 +17,7 @@ def plot_path_planner(
     graphs: list[SearchGraph] = [],
     path: Path | None = None,
     path_color: Sequence[float] | str = "m",
+    artists: dict[str, list[Artist]] | None = None,
 ) -> dict[str, list[Artist]]:
     """
     Plots the planned path on a specified set of axes.
@@ -24,55 +26,95 @@ def plot_path_planner(
     :param graphs: A list of path planner graphs to display.
     :param path: Path to display.
     :param path_color: Color of the path, as an RGB tuple or string.
+    :param artists: Artists returned by a previous call on the same axes, if any.
+        Where possible, these are updated in place rather than created again,
+        and the ones that are no longer needed are removed from the axes.
     :return: List of Matplotlib artists containing what was drawn,
         used for bookkeeping.
     """
     graph_artists: list[Artist] = []
     path_artists: list[Artist] = []
-    artists: dict[str, list[Artist]] = {}
+    artists = artists or {}
+    prev_graph_artists = artists.get("graph", [])
+    prev_path_artists = artists.get("path", [])
 
-    for graph in graphs:
-        # Plot the markers
-        (markers,) = axes.plot(
-            [n.pose.x for n in graph.nodes],
-            [n.pose.y for n in graph.nodes],
-            color=graph.color,
-            alpha=graph.color_alpha,
-            linestyle="",
-            marker="o",
-            markerfacecolor=graph.color,
-            markeredgecolor=graph.color,
-            markersize=3,
-            zorder=1,
-        )
-        graph_artists.append(markers)
+    for idx, graph in enumerate(graphs):
+        nodes_xy = graph.get_nodes_xy()
+        edges_xy = graph.get_edges_xy()
+        prev_artists: Sequence[Artist | None] = [None, None]
+        if len(prev_graph_artists) >= 2 * idx + 2:
+            prev_artists = prev_graph_artists[2 * idx : 2 * idx + 2]
+        markers, line_segments = prev_artists
+        if isinstance(markers, Line2D) and isinstance(line_segments, LineCollection):
+            # Reuse the markers and edges from the previous call.
+            markers.set_data(nodes_xy[:, 0], nodes_xy[:, 1])
+            markers.set(
+                color=graph.color,
+                alpha=graph.color_alpha,
+                markerfacecolor=graph.color,
+                markeredgecolor=graph.color,
+            )
+            line_segments.set_segments(edges_xy)  # type: ignore[arg-type]
+            line_segments.set(color=graph.color, alpha=graph.color_alpha)
+        else:
+            # Plot the markers
+            (markers,) = axes.plot(
+                nodes_xy[:, 0],
+                nodes_xy[:, 1],
+                color=graph.color,
+                alpha=graph.color_alpha,
+                linestyle="",
+                marker="o",
+                markerfacecolor=graph.color,
+                markeredgecolor=graph.color,
+                markersize=3,
+                zorder=1,
+            )
 
-        # Plot the edges as a LineCollection
-        edge_coords = [
-            [[e.nodeA.pose.x, e.nodeA.pose.y], [e.nodeB.pose.x, e.nodeB.pose.y]]
-            for e in graph.edges
-        ]
-        line_segments = LineCollection(
-            edge_coords,
-            color=graph.color,
-            alpha=graph.color_alpha,
-            linewidth=0.5,
-            linestyle="--",
-            zorder=1,
-        )
-        axes.add_collection(line_segments)
-        graph_artists.append(line_segments)
+            # Plot the edges as a LineCollection
+            line_segments = LineCollection(
+                edges_xy,  # type: ignore[arg-type]
+                color=graph.color,
+                alpha=graph.color_alpha,
+                linewidth=0.5,
+                linestyle="--",
+                zorder=1,
+            )
+            axes.add_collection(line_segments)
+        graph_artists.extend((markers, line_segments))
 
     if path and path.num_poses > 0:
-        x = [p.x for p in path.poses]
-        y = [p.y for p in path.poses]
-        (path,) = axes.plot(
-            x, y, linestyle="-", color=path_color, linewidth=3, alpha=0.5, zorder=1
-        )
-        (start,) = axes.plot(x[0], y[0], "go", zorder=2)
-        (goal,) = axes.plot(x[-1], y[-1], "rx", zorder=2)
-        path_artists.extend((path, start, goal))
+        path_xy = path.get_xy()
+        x = path_xy[:, 0]
+        y = path_xy[:, 1]
+        prev_artists = [None, None, None]
+        if len(prev_path_artists) == 3:
+            prev_artists = prev_path_artists
+        path_line, start, goal = prev_artists
+        if (
+            isinstance(path_line, Line2D)
+            and isinstance(start, Line2D)
+            and isinstance(goal, Line2D)
+        ):
+            # Reuse the path, start, and goal lines from the previous call.
+            path_line.set_data(x, y)
+            path_line.set(color=path_color)
+            start.set_data(x[:1], y[:1])
+            goal.set_data(x[-1:], y[-1:])
+        else:
+            (path_line,) = axes.plot(
+                x, y, linestyle="-", color=path_color, linewidth=3, alpha=0.5, zorder=1
+            )
+            (start,) = axes.plot(x[0], y[0], "go", zorder=2)
+            (goal,) = axes.plot(x[-1], y[-1], "rx", zorder=2)
+        path_artists.extend((path_line, start, goal))
 
+    # Remove any previous artists that were not reused.
+    for artist in prev_graph_artists + prev_path_artists:
+        if (artist not in graph_artists) and (artist not in path_artists):
+            artist.remove()
+
+    artists = {}
     if graph_artists:
         artists["graph"] = graph_artists
     if path_artists:
@@ -1,19 +1,25 @@
 """Lidar sensor simulation."""
 
+import math
 import time
 from typing import Any
 
 from matplotlib.artist import Artist
 from matplotlib.collections import LineCollection
 import numpy as np
-from shapely import get_parts, intersects, intersection_all
+from shapely import (
+    get_parts,
+    intersects,
+    intersection_all,
+    length,
+    linestrings,
+    multilinestrings,
+)
 from shapely.geometry import LineString, MultiLineString
 from shapely.ops import unary_union
 
 from .types import Sensor
 
-from ..utils.polygon import transform_polygon
-
 
 class Lidar2D(Sensor):
     """
@@ -60,15 +66,14 @@ class Lidar2D(Sensor):
             * units_scaling
         )
         self.num_beams = len(self.angles)
+        # Beam directions in the sensor frame. At each update, these only need
+        # to be rotated by the robot yaw rather than recomputed for every beam.
+        self.cos_angles = np.cos(self.angles)
+        self.sin_angles = np.sin(self.angles)
         self.orig_lidar_lines = MultiLineString(
             [
-                np.array(
-                    [
-                        [0.0, 0.0],
-                        [max_range_m * np.cos(angle), max_range_m * np.sin(angle)],
-                    ]
-                )
-                for angle in self.angles
+                np.array([[0.0, 0.0], [max_range_m * c, max_range_m * s]])
+                for c, s in zip(self.cos_angles, self.sin_angles)
             ]
         )
         self.lidar_lines: list[LineString] = []
@@ -82,13 +87,26 @@ class Lidar2D(Sensor):
         if self.robot.world:
             # Need to extract the robot polygon here to prevent syncing issues.
             robot_polygon = self.robot.polygon
+
+            # Get the full-range beams in the world frame, using the angle sum identities
+            # to rotate the precomputed beam directions by the robot yaw.
+            pose = self.robot.get_pose()
+            yaw = pose.get_yaw()
+            cos_yaw = math.cos(yaw)
+            sin_yaw = math.sin(yaw)
+            beam_coords = np.empty((self.num_beams, 2, 2))
+            beam_coords[:, 0, 0] = pose.x
+            beam_coords[:, 0, 1] = pose.y
+            beam_coords[:, 1, 0] = pose.x + self.max_range_m * (
+                self.cos_angles * cos_yaw - self.sin_angles * sin_yaw
+            )
+            beam_coords[:, 1, 1] = pose.y + self.max_range_m * (
+                self.sin_angles * cos_yaw + self.cos_angles * sin_yaw
+            )
+            beams = multilinestrings(linestrings(beam_coords))
+
             lines = (
-                intersection_all(
-                    [
-                        transform_polygon(self.orig_lidar_lines, self.robot.get_pose()),
-                        self.robot.world.total_external_polygon,
-                    ]
-                )
+                intersection_all([beams, self.robot.world.total_external_polygon])
                 .difference(
                     unary_union(
                         [
@@ -122,10 +140,9 @@ class Lidar2D(Sensor):
 
         :return: An array of all the lengths, corresponding to the `angles` attribute.
         """
-        if len(self.lidar_lines) == 0:
-            return np.array([])
-
-        return np.array([line.length for line in self.lidar_lines])
+        # Computes all the lengths in a single vectorized call.
+        # If there are no lidar lines yet, this returns an empty array.
+        return np.asarray(length(self.lidar_lines), dtype=np.float64)
 
     def setup_artists(self) -> list[Artist]:
         """
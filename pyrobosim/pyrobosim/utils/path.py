@@ -2,6 +2,7 @@
 Path representation for motion planning.
 """
 
+import numpy as np
 from typing_extensions import Self  # For compatibility with Python <= 3.10
 
 from .pose import Pose
@@ -32,10 +33,25 @@ class Path:
         """
         self.poses = poses
         self.num_poses = len(self.poses)
+        self._xy: np.ndarray | None = None
         self.length = 0.0
         for i in range(self.num_poses - 1):
             self.length += self.poses[i].get_linear_distance(self.poses[i + 1])
 
+    def get_xy(self) -> np.ndarray:
+        """
+        Gets the XY coordinates of all the poses in the path.
+
+        The result is cached until the poses are changed with `set_poses()`.
+
+        :return: An array of shape (N, 2) containing the pose coordinates.
+        """
+        if self._xy is None:
+            self._xy = np.array(
+                [(p.x, p.y) for p in self.poses], dtype=np.float64
+            ).reshape(-1, 2)
+        return self._xy
+
     def fill_yaws(self) -> None:
         """
         Fills in any yaw angles along a path to point at the next waypoint.
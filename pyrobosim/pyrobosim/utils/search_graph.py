@@ -28,6 +28,9 @@ class SearchGraph:
 
         self.nodes: set[Node] = set()
         self.edges: set[Edge] = set()
+        # Cached coordinate arrays for plotting, invalidated on graph changes.
+        self._nodes_xy: np.ndarray | None = None
+        self._edges_xy: np.ndarray | None = None
         self.color = color
         self.color_alpha = color_alpha
         self.path_finder: SearchGraphPlanner | None = (
@@ -41,6 +44,7 @@ class SearchGraph:
         :param node: The node to be added into the graph.
         """
         self.nodes.add(node)
+        self._nodes_xy = None
 
     def remove_node(self, node: Node) -> None:
         """
@@ -58,6 +62,8 @@ class SearchGraph:
                 edges_to_remove.append(edge)
         for edge in edges_to_remove:
             self.edges.discard(edge)
+        self._nodes_xy = None
+        self._edges_xy = None
 
     def add_edge(self, nodeA: Node, nodeB: Node) -> Edge:
         """
@@ -69,6 +75,7 @@ class SearchGraph:
         """
         edge = Edge(nodeA, nodeB)
         self.edges.add(edge)
+        self._edges_xy = None
         nodeA.neighbors.add(nodeB)
         nodeB.neighbors.add(nodeA)
         return edge
@@ -89,6 +96,39 @@ class SearchGraph:
                 edges_to_remove.append(edge)
         for edge in edges_to_remove:
             self.edges.discard(edge)
+        self._edges_xy = None
+
+    def get_nodes_xy(self) -> np.ndarray:
+        """
+        Gets the XY coordinates of all the graph nodes.
+
+        The result is cached until the graph is modified through its methods.
+
+        :return: An array of shape (N, 2) containing the node coordinates.
+        """
+        if self._nodes_xy is None:
+            self._nodes_xy = np.array(
+                [(n.pose.x, n.pose.y) for n in self.nodes], dtype=np.float64
+            ).reshape(-1, 2)
+        return self._nodes_xy
+
+    def get_edges_xy(self) -> np.ndarray:
+        """
+        Gets the XY coordinates of the endpoints of all the graph edges.
+
+        The result is cached until the graph is modified through its methods.
+
+        :return: An array of shape (E, 2, 2) containing the edge coordinates.
+        """
+        if self._edges_xy is None:
+            self._edges_xy = np.array(
+                [
+                    ((e.nodeA.pose.x, e.nodeA.pose.y), (e.nodeB.pose.x, e.nodeB.pose.y))
+                    for e in self.edges
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 2, 2)
+        return self._edges_xy
 
     def nearest(self, pose: Pose) -> Node | None:
         """
@@ -31,6 +31,12 @@ class Trajectory:
         self.t_pts = np.array(t_pts)
         self.poses = np.array(poses)
 
+        # Also store the pose components as contiguous arrays.
+        self.xs = np.array([pose.x for pose in poses], dtype=np.float64)
+        self.ys = np.array([pose.y for pose in poses], dtype=np.float64)
+        self.zs = np.array([pose.z for pose in poses], dtype=np.float64)
+        self.yaws = np.array([pose.get_yaw() for pose in poses], dtype=np.float64)
+
     def num_points(self) -> int:
         """
         Returns the number of points in a trajectory.
@@ -65,6 +71,10 @@ class Trajectory:
         else:
             self.t_pts = np.delete(self.t_pts, idx)
             self.poses = np.delete(self.poses, idx)
+            self.xs = np.delete(self.xs, idx)
+            self.ys = np.delete(self.ys, idx)
+            self.zs = np.delete(self.zs, idx)
+            self.yaws = np.delete(self.yaws, idx)
             return True
 
 
@@ -138,21 +148,15 @@ def interpolate_trajectory(traj: Trajectory, dt: float) -> Trajectory | None:
     # Interpolate the translation elements linearly
     if t_final not in t_interp:
         t_interp = np.append(t_interp, t_final)
-    x_interp = np.interp(
-        t_interp, modified_traj.t_pts, [pose.x for pose in modified_traj.poses]
-    )
-    y_interp = np.interp(
-        t_interp, modified_traj.t_pts, [pose.y for pose in modified_traj.poses]
-    )
-    z_interp = np.interp(
-        t_interp, modified_traj.t_pts, [pose.z for pose in modified_traj.poses]
-    )
+    x_interp = np.interp(t_interp, modified_traj.t_pts, modified_traj.xs)
+    y_interp = np.interp(t_interp, modified_traj.t_pts, modified_traj.ys)
+    z_interp = np.interp(t_interp, modified_traj.t_pts, modified_traj.zs)
 
     # Set up Slerp interpolation for the angle.
     if t_final > 0:
         euler_angs = [pose.eul for pose in modified_traj.poses]
         slerp = Slerp(modified_traj.t_pts, Rotation.from_euler("xyz", euler_angs))
-        eul_interp = [slerp(t).as_euler("xyz", degrees=False) for t in t_interp]
+        eul_interp = slerp(t_interp).as_euler("xyz", degrees=False)
     else:
         eul_interp = [modified_traj.poses[-1].eul]
 
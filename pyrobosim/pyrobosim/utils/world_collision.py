@@ -111,17 +111,55 @@ def is_path_collision_free(
     :param step_dist: The step size for discretizing a straight line to check collisions.
     :return: True if the path is collision free, else False.
     """
+    path_xy = path.get_xy()
+    return is_path_collision_free_xy(
+        path_xy[:, 0], path_xy[:, 1], robot=robot, step_dist=step_dist
+    )
+
+
+def is_path_collision_free_xy(
+    xs: Sequence[float] | np.ndarray,
+    ys: Sequence[float] | np.ndarray,
+    robot: Robot,
+    step_dist: float = 0.01,
+) -> bool:
+    """
+    Check whether a path given as waypoint coordinate arrays is collision free in this world.
+
+    The straight line segments between waypoints are discretized the same way as in
+    :func:`is_connectable`, but all the resulting points are checked in a single call.
+
+    :param xs: The X coordinates of the path waypoints.
+    :param ys: The Y coordinates of the path waypoints.
+    :param robot: The robot instance used for collision checking.
+    :param step_dist: The step size for discretizing a straight line to check collisions.
+    :return: True if the path is collision free, else False.
+    """
     if robot.world is None:
         robot.logger.error("Robot is not attached to World.")
         raise RuntimeError("Robot is not attached to World.")
 
-    for idx in range(len(path.poses) - 1):
-        if not is_connectable(
-            path.poses[idx],
-            path.poses[idx + 1],
-            robot.world,
-            robot,
-            step_dist,
-        ):
-            return False
-    return True
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    dxs = np.diff(xs)
+    dys = np.diff(ys)
+    dists = np.hypot(dxs, dys)
+
+    # Number of points to check along each segment, excluding the segment start.
+    num_checks = np.maximum(np.ceil(dists / step_dist).astype(np.int64) - 1, 0)
+    total_checks = int(num_checks.sum())
+    if total_checks == 0:
+        return True
+
+    # Build up the arrays of test X and Y coordinates for all segments at once.
+    seg_idxs = np.repeat(np.arange(len(dists)), num_checks)
+    seg_offsets = np.repeat(np.cumsum(num_checks) - num_checks, num_checks)
+    check_dists = (np.arange(total_checks) - seg_offsets + 1) * step_dist
+    scale = check_dists / dists[seg_idxs]
+    x_pts = xs[seg_idxs] + scale * dxs[seg_idxs]
+    y_pts = ys[seg_idxs] + scale * dys[seg_idxs]
+
+    # Every test point must be in the free configuration space.
+    return bool(
+        np.all(shapely.intersects_xy(robot.total_internal_polygon, x_pts, y_pts))
+    )
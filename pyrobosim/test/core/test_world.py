@@ -7,11 +7,15 @@ import pytest
 from pytest import LogCaptureFixture
 import numpy as np
 
-from pyrobosim.core import Hallway, Object, World
+from pyrobosim.core import Hallway, Object, World, WorldYamlLoader
 from pyrobosim.utils.pose import Pose
 
 from pyrobosim.utils.general import get_data_folder
-from pyrobosim.utils.world_collision import check_occupancy, is_connectable
+from pyrobosim.utils.world_collision import (
+    check_occupancy,
+    is_connectable,
+    is_path_collision_free_xy,
+)
 
 
 class TestWorldModeling:
@@ -430,6 +434,37 @@ class TestWorldModeling:
             pose_start, pose_goal, TestWorldModeling.world, step_dist=0.5
         )
 
+    @staticmethod
+    @pytest.mark.dependency(depends=["TestWorldModeling::test_is_connectable"])  # type: ignore[misc]
+    def test_is_path_collision_free_xy() -> None:
+        """Tests if paths given as coordinate arrays are collision free."""
+        robot = TestWorldModeling.world.robots[0]
+
+        # A single waypoint, or coincident waypoints, are trivially collision free.
+        assert is_path_collision_free_xy([1.0], [0.25], robot)
+        assert is_path_collision_free_xy([1.0, 1.0], [0.25, 0.25], robot)
+
+        # Paths in free space should be collision free.
+        assert is_path_collision_free_xy([1.0, 0.5], [0.25, 1.0], robot)
+
+        # Any segment in collision should mark the path as in collision.
+        assert not is_path_collision_free_xy(
+            [1.0, 1.5, 3.0], [0.25, 2.4, 2.75], robot, step_dist=0.01
+        )
+
+        # The result should agree with checking each segment separately.
+        xs = np.array([1.0, 0.5, 1.3, 1.5, 3.0])
+        ys = np.array([0.25, 1.0, 2.2, 2.4, 2.75])
+        for idx in range(len(xs) - 1):
+            assert is_path_collision_free_xy(
+                xs[idx : idx + 2], ys[idx : idx + 2], robot
+            ) == is_connectable(
+                Pose(x=xs[idx], y=ys[idx]),
+                Pose(x=xs[idx + 1], y=ys[idx + 1]),
+                TestWorldModeling.world,
+                robot,
+            )
+
     @staticmethod
     @pytest.mark.dependency(  # type: ignore[misc]
         depends=[
@@ -497,10 +532,29 @@ class TestWorldModeling:
         assert len(hallways) == 1
         assert isinstance(hallways[0], Hallway)
 
-        assert TestWorldModeling.world.remove_hallway(hallways[0]) is True
+        removed_hallway = hallways[0]
+        assert TestWorldModeling.world.remove_hallway(removed_hallway) is True
         hallways = TestWorldModeling.world.get_hallways_from_rooms("kitchen", "bedroom")
         assert len(hallways) == 0
 
+        # The hallway spatial index should no longer contain the removed hallway.
+        world = TestWorldModeling.world
+        hallway_tree, tree_hallways = world.hallway_index
+        assert removed_hallway not in tree_hallways
+        assert len(hallway_tree) == len(world.hallways)
+
+        # Removing a hallway with a nonzero inflation radius should not grow the free space.
+        world = WorldYamlLoader().from_file(
+            os.path.join(get_data_folder(), "test_world.yaml")
+        )
+        assert world.inflation_radius > 0.0
+        robot = world.robots[0]
+        free_area = world.total_internal_polygon.area
+        robot_free_area = robot.total_internal_polygon.area
+        assert world.remove_hallway("hall_bathroom_kitchen") is True
+        assert world.total_internal_polygon.area < free_area
+        assert robot.total_internal_polygon.area < robot_free_area
+
     @staticmethod
     @pytest.mark.dependency(depends=["TestWorldModeling::test_create_room"])  # type: ignore[misc]
     def test_remove_room() -> None:
@@ -104,3 +104,34 @@ def test_detect_hallway_states() -> None:
     assert robot.recorded_closed_hallways == set()
 
     robot.stop_sensor_threads()  # Ensures test can terminate
+
+
+def test_stop_detect_hallway_states() -> None:
+    """Tests that the hallway state detection thread stops without waiting for its next measurement."""
+    world = WorldYamlLoader().from_file(
+        os.path.join(get_data_folder(), "test_world.yaml")
+    )
+    robot = world.robots[0]
+    robot.partial_obs_hallways = True
+    lidar = Lidar2D(
+        update_rate_s=0.1,
+        angle_units="degrees",
+        min_angle=-120.0,
+        max_angle=120.0,
+        angular_resolution=5.0,
+        max_range_m=2.0,
+    )
+    robot.set_sensors({"lidar": lidar})
+
+    path_executor = ConstantVelocityExecutor(
+        lidar_sensor_name="lidar", lidar_sensor_measurement_dt=10.0
+    )
+    robot.set_path_executor(path_executor)
+    lidar_thread = path_executor.lidar_sensor_timer
+    assert lidar_thread is not None
+    assert lidar_thread.is_alive()
+
+    robot.stop_sensor_threads()
+    assert path_executor.cancel_all_threads
+    lidar_thread.join(timeout=1.0)
+    assert not lidar_thread.is_alive()
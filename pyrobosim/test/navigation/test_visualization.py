@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+"""Unit tests for path planner visualization."""
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from pyrobosim.navigation.visualization import plot_path_planner
+from pyrobosim.utils.path import Path
+from pyrobosim.utils.pose import Pose
+from pyrobosim.utils.search_graph import Node, SearchGraph
+
+
+def create_test_graph(coords: list[tuple[float, float]]) -> SearchGraph:
+    """Creates a test graph with nodes connected in a chain."""
+    graph = SearchGraph()
+    nodes = [Node(Pose(x=x, y=y)) for x, y in coords]
+    for node in nodes:
+        graph.add_node(node)
+    for node, next_node in zip(nodes[:-1], nodes[1:]):
+        graph.add_edge(node, next_node)
+    return graph
+
+
+def test_plot_path_planner_reuses_artists() -> None:
+    """Tests that plotting again on the same axes reuses and removes artists."""
+    fig = Figure()
+    canvas = FigureCanvasAgg(fig)
+    axes = fig.add_subplot()
+
+    graphs = [
+        create_test_graph([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)]),
+        create_test_graph([(2.0, 2.0), (3.0, 2.0)]),
+    ]
+    path = Path(poses=[Pose(x=0.0, y=0.0), Pose(x=1.0, y=1.0), Pose(x=2.0, y=2.0)])
+
+    # Plot two graphs and a path.
+    first_artists = plot_path_planner(axes, graphs=graphs, path=path)
+    first_graph_artists = first_artists["graph"]
+    first_path_artists = first_artists["path"]
+    assert len(first_graph_artists) == 4
+    assert len(first_path_artists) == 3
+    assert len(axes.lines) == 5  # 2 sets of graph markers, and the path lines
+    assert len(axes.collections) == 2  # The edges of each graph
+    canvas.draw()
+
+    # Plot again with a single, different graph and no path.
+    new_graph = create_test_graph([(-1.0, -1.0), (-2.0, -1.0)])
+    second_artists = plot_path_planner(
+        axes, graphs=[new_graph], path=None, artists=first_artists
+    )
+    assert "path" not in second_artists
+
+    # The artists for the first graph should be the same instances, with updated data.
+    markers, line_segments = second_artists["graph"]
+    assert markers is first_graph_artists[0]
+    assert line_segments is first_graph_artists[1]
+    assert isinstance(markers, Line2D)
+    assert isinstance(line_segments, LineCollection)
+    assert np.all(np.column_stack(markers.get_data()) == new_graph.get_nodes_xy())
+    assert len(line_segments.get_segments()) == len(new_graph.edges)
+
+    # The artists for the second graph and the path should be removed from the axes.
+    for artist in first_graph_artists[2:] + first_path_artists:
+        assert artist not in axes.lines
+        assert artist not in axes.collections
+    assert list(axes.lines) == [markers]
+    assert list(axes.collections) == [line_segments]
+    canvas.draw()
@@ -35,4 +35,5 @@ def test_lidar_2d() -> None:
     lidar.update()
     latest_measurement = lidar.get_measurement()
     assert len(latest_measurement) == len(lidar.angles)
+    assert latest_measurement.dtype == np.float64
     assert np.all(latest_measurement <= lidar.max_range_m)
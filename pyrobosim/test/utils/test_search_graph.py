@@ -180,3 +180,21 @@ def test_search_graph_find_path(caplog: LogCaptureFixture) -> None:
     path = graph.find_path(nodes[0], new_node)
     assert path.num_poses == 0
     assert "Could not find a path from start to goal." in caplog.text
+
+
+def test_search_graph_coordinate_arrays() -> None:
+    graph = SearchGraph()
+    assert graph.get_nodes_xy().shape == (0, 2)
+    assert graph.get_edges_xy().shape == (0, 2, 2)
+
+    graph, nodes = create_test_graph()
+    nodes_xy = graph.get_nodes_xy()
+    assert nodes_xy.shape == (4, 2)
+    assert graph.get_edges_xy().shape == (len(graph.edges), 2, 2)
+    assert graph.get_nodes_xy() is nodes_xy  # Cached until the graph changes
+
+    graph.remove_node(nodes[0])
+    nodes_xy = graph.get_nodes_xy()
+    assert nodes_xy.shape == (3, 2)
+    assert not np.any(np.all(nodes_xy == [0.0, 0.0], axis=1))
+    assert graph.get_edges_xy().shape == (len(graph.edges), 2, 2)
@@ -43,6 +43,11 @@ def test_create_trajectory() -> None:
     assert traj.poses[2].y == 1.3
     assert traj.poses[2].get_yaw() == np.pi / 2
 
+    assert np.all(traj.xs == [0.1, 0.2, 0.3])
+    assert np.all(traj.ys == [1.1, 1.2, 1.3])
+    assert np.all(traj.zs == [0.0, 0.0, 0.0])
+    assert np.all(traj.yaws == [0.0, np.pi / 4, np.pi / 2])
+
 
 def test_delete_empty_trajectory(caplog: LogCaptureFixture) -> None:
     traj = Trajectory()
@@ -78,6 +83,9 @@ def test_delete() -> None:
 
     traj.delete(1)
     assert traj.num_points() == 2
+    assert np.all(traj.xs == [0.1, 0.3])
+    assert np.all(traj.ys == [1.1, 1.3])
+    assert np.all(traj.yaws == [0.0, np.pi / 2])
 
     assert traj.poses[0].x == 0.1
     assert traj.poses[0].y == 1.1